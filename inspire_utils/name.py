@@ -31,6 +31,7 @@ from nameparser import HumanName
 from nameparser.config import Constants
 from unidecode import unidecode
 
+from inspire_utils.compat import lru_cache
 from inspire_utils.logging import getStackTraceLogger
 from inspire_utils.query import wrap_queries_in_bool_clauses_if_more_than_one
 
@@ -40,6 +41,10 @@ _LASTNAME_NON_LASTNAME_SEPARATORS = [u' ', u', ']
 _NAMES_MAX_NUMBER_THRESHOLD = 5
 """Threshold for skipping the combinatorial expansion of names (when generating
 name variations)."""
+_INITIALS_SPLIT_PATTERN = re.compile(r"\.(?=[A-Za-z]|\s|$)")
+"""Splits dotted initials written without a space, e.g. ``J.D.``."""
+_ROMAN_NUMERAL_CHARACTERS = frozenset(u'MDCLXVI()')
+"""Characters allowed in a suffix for it to be treated as a roman numeral."""
 
 
 def _prepare_nameparser_constants():
@@ -84,6 +89,19 @@ def _prepare_nameparser_constants():
     return constants
 
 
+def _copy_nameparser_constants_without_titles(constants):
+    """Copy nameparser Constants, leaving out all the titles.
+
+    The copy is made attribute by attribute, as pickling-based copying of
+    `Constants` re-initializes it from its public attributes, which loses
+    the adjustments done in :func:`_prepare_nameparser_constants`.
+    """
+    constants_without_titles = Constants.__new__(Constants)
+    constants_without_titles.__dict__.update(vars(constants))
+    constants_without_titles.titles = []
+    return constants_without_titles
+
+
 class ParsedName(object):
     """Class for representing a name.
 
@@ -104,11 +122,13 @@ class ParsedName(object):
                 for `HumanName` instantiation.
                 (Can be None, if provided it overwrites the default one generated in
                 :method:`prepare_nameparser_constants`.)
+            without_titles (bool): ``True`` if titles should not be recognized
+                in the name. The given constants are left untouched.
         """
         if not constants:
             constants = ParsedName.constants
         if without_titles:
-            constants.titles = []
+            constants = _copy_nameparser_constants_without_titles(constants)
 
         if isinstance(name, HumanName):
             self._parsed_name = name
@@ -186,9 +206,14 @@ class ParsedName(object):
         return self._parsed_name.suffix_list
 
     @classmethod
-    def loads(cls, name):
+    def loads(cls, name, without_titles=False):
         """Load a parsed name from a string.
 
+        Args:
+            name (str): The name to be parsed.
+            without_titles (bool): ``True`` if titles should not be recognized
+                in the name.
+
         Raises:
             TypeError: when name isn't a type of `six.string_types`.
             ValueError: when name is empty or None.
@@ -202,7 +227,7 @@ class ParsedName(object):
         if not name or name.isspace():
             raise ValueError('name must not be empty')
 
-        return cls(name)
+        return cls(name, without_titles=without_titles)
 
     def dumps(self):
         """Dump the name to string, after normalizing it."""
@@ -222,22 +247,6 @@ class ParsedName(object):
                 author_suffix = u''.join(seq)
             return author_suffix
 
-        def _is_roman_numeral(suffix):
-            """Controls that the user's input only contains valid roman
-            numerals."""
-            valid_roman_numerals = [
-                u'M',
-                u'D',
-                u'C',
-                u'L',
-                u'X',
-                u'V',
-                u'I',
-                u'(',
-                u')',
-            ]
-            return all(letters in valid_roman_numerals for letters in suffix.upper())
-
         first_and_middle_names = iter(
             _ensure_dotted_initials(name) for name in self.first_list
         )
@@ -257,7 +266,7 @@ class ParsedName(object):
 
         normalized_names = u''.join(names_with_spaces)
 
-        if _is_roman_numeral(self.suffix):
+        if all(letter in _ROMAN_NUMERAL_CHARACTERS for letter in self.suffix.upper()):
             suffix = self.suffix.upper()
         else:
             suffix = _ensure_dotted_suffixes(self.suffix)
@@ -324,27 +333,6 @@ class ParsedName(object):
             "nested": {"path": keyword, "query": {"bool": {"must": []}}},
         }
 
-        def _match_query_with_names_initials_analyzer_with_and_operator(field, value):
-            return {
-                "match": {
-                    field: {
-                        "query": value,
-                        "operator": "AND",
-                        "analyzer": "names_initials_analyzer",
-                    }
-                }
-            }
-
-        def _match_query_with_and_operator(field, value):
-            return {"match": {field: {"query": value, "operator": "AND"}}}
-
-        def _match_phrase_prefix_query(field, value):
-            return {
-                "match_phrase_prefix": {
-                    field: {"query": value, "analyzer": "names_analyzer"}
-                }
-            }
-
         if len(self) == 1 and "." not in self.first:
             # ParsedName returns first name if there is only one name i.e. `Smith`
             # in our case we consider it as a lastname
@@ -359,7 +347,7 @@ class ParsedName(object):
             _match_query_with_and_operator(u"{}.last_name".format(keyword), self.last)
         ]
         author_names = [
-            re.split(r"\.(?=[A-Za-z]|\s|$)", name) for name in self.first_list
+            _INITIALS_SPLIT_PATTERN.split(name) for name in self.first_list
         ]
         first_names = filter(None, chain.from_iterable(author_names))
 
@@ -405,9 +393,37 @@ class ParsedName(object):
         return nested_query
 
 
+def _match_query_with_names_initials_analyzer_with_and_operator(field, value):
+    return {
+        "match": {
+            field: {
+                "query": value,
+                "operator": "AND",
+                "analyzer": "names_initials_analyzer",
+            }
+        }
+    }
+
+
+def _match_query_with_and_operator(field, value):
+    return {"match": {field: {"query": value, "operator": "AND"}}}
+
+
+def _match_phrase_prefix_query(field, value):
+    return {
+        "match_phrase_prefix": {
+            field: {"query": value, "analyzer": "names_analyzer"}
+        }
+    }
+
+
+@lru_cache(maxsize=8192)
 def normalize_name(name):
     """Normalize name.
 
+    The result is memoized, as the same author names come up over and over
+    again.
+
     Args:
         name (six.text_type): The name to be normalized.
 
@@ -475,23 +491,50 @@ def generate_name_variations(name):
         name (six.text_type): The name whose variations are to be generated.
 
     Returns:
-        list: All the name variations for the given name.
+        list: All the name variations for the given name, without duplicates.
 
     Notes:
         Uses `unidecode` for doing unicode characters transliteration to ASCII ones.
         This was chosen so that we can map both full names of authors in HEP records
         and user's input to the same space and thus make exact queries work.
+
+        Variations are cached per input name; every call gets its own copy
+        of the list.
     """
+    return list(_generate_name_variations(name))
+
+
+@lru_cache(maxsize=4096)
+def _generate_name_variations(name):
+    separators = u''.join(_LASTNAME_NON_LASTNAME_SEPARATORS)
 
     def _update_name_variations_with_product(set_a, set_b):
+        # ``unidecode`` works character by character, so each name part is
+        # transliterated and lowercased once up front instead of once per
+        # variation. Empty parts are marked with ``None``, as the separator
+        # next to them gets stripped.
+        parts_a = [
+            (
+                part,
+                unidecode(part.lstrip(separators)).lower() if part.strip(separators) else None,
+            )
+            for part in set_a
+        ]
+        parts_b = [
+            (
+                part,
+                unidecode(part.rstrip(separators)).lower() if part.strip(separators) else None,
+            )
+            for part in set_b
+        ]
         name_variations.update(
             [
-                unidecode(
-                    (names_variation[0] + separator + names_variation[1]).strip(
-                        ''.join(_LASTNAME_NON_LASTNAME_SEPARATORS)
-                    )
-                ).lower()
-                for names_variation in product(set_a, set_b)
+                transliterated_a + separator + transliterated_b
+                if transliterated_a is not None and transliterated_b is not None
+                else unidecode((part_a + part_b).strip(separators)).lower()
+                for (part_a, transliterated_a), (part_b, transliterated_b) in product(
+                    parts_a, parts_b
+                )
                 for separator in _LASTNAME_NON_LASTNAME_SEPARATORS
             ]
         )
@@ -500,7 +543,7 @@ def generate_name_variations(name):
 
     # Handle rare-case of single-name
     if len(parsed_name) == 1:
-        return [parsed_name.dumps().lower()]
+        return (parsed_name.dumps().lower(),)
 
     name_variations = set()
 
@@ -523,7 +566,7 @@ def generate_name_variations(name):
         LOGGER.warning(
             'Skipping name variations generation - too many names in: "%s"', name
         )
-        return [name]
+        return (name,)
 
     non_lastnames_variations = _generate_non_lastnames_variations(non_lastnames)
     lastnames_variations = _generate_lastnames_variations(parsed_name.last_list)
@@ -535,7 +578,7 @@ def generate_name_variations(name):
     # Second part of transformations - having the lastnames in the end.
     _update_name_variations_with_product(non_lastnames_variations, lastnames_variations)
 
-    return list(name_variations)
+    return tuple(name_variations)
 
 
 def format_name(name, initials_only=False, without_titles=False):
@@ -557,8 +600,4 @@ def format_name(name, initials_only=False, without_titles=False):
     >>> format_name('Downey, Robert Jr.', initials_only=True)
     u'R. Downey Jr.'
     """
-    return (
-        ParsedName(name=name, without_titles=without_titles)
-        .loads(name)
-        .pprint(initials_only)
-    )
+    return ParsedName.loads(name, without_titles=without_titles).pprint(initials_only)
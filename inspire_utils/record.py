@@ -26,10 +26,55 @@ import re
 
 from six import string_types
 
+from inspire_utils.compat import lru_cache
 from inspire_utils.logging import getStackTraceLogger
 
 LOGGER = getStackTraceLogger(__name__)
 SPLIT_KEY_PATTERN = re.compile(r"\.|\[")
+_MISSING = object()
+
+
+def _parse_index(step):
+    """Parse an index or slice step of a :func:`get_value` key, e.g. ``1]``."""
+    index = step[:-1].replace("n", "-1")
+    try:
+        return int(index)
+    except ValueError:
+        return slice(
+            *map(
+                lambda x: int(x.strip()) if x.strip() else None,
+                index.split(":"),
+            )
+        )
+
+
+def _parse_index_step(step):
+    """Return ``(step, index)`` for an index or slice step.
+
+    The index is ``None`` if the step cannot be parsed; the error is only
+    raised once the step is actually used on a list.
+    """
+    try:
+        return step, _parse_index(step)
+    except (TypeError, ValueError):
+        return step, None
+
+
+@lru_cache(maxsize=512)
+def _split_key(key):
+    """Split a :func:`get_value` key into its steps.
+
+    Callers use a small set of keys over and over, so the result is cached
+    instead of parsing the key again on every lookup. Index and slice steps
+    are parsed here as well and returned as ``(step, index)`` tuples.
+    """
+    # Keys without indexes or slices (the common case) only need a plain split
+    if "[" in key or "]" in key:
+        return tuple(
+            _parse_index_step(step) if "]" in step else step
+            for step in SPLIT_KEY_PATTERN.split(key)
+        )
+    return tuple(key.split("."))
 
 
 def get_value(record, key, default=None):
@@ -50,32 +95,35 @@ def get_value(record, key, default=None):
     def getitem(k, v, default):
         if isinstance(v, string_types):
             raise KeyError
-        elif isinstance(v, dict):
-            return v[k]
-        elif "]" in k:
-            k = k[:-1].replace("n", "-1")
+        elif isinstance(k, tuple):
+            step, index = k
+            if isinstance(v, dict):
+                return v[step]
+            if index is None:
+                # Raise the parsing error now that the step is used on a list
+                index = _parse_index(step)
             # Work around for list indexes and slices
             try:
-                return v[int(k)]
+                return v[index]
             except IndexError:
                 return default
-            except ValueError:
-                return v[
-                    slice(
-                        *map(
-                            lambda x: int(x.strip()) if x.strip() else None,
-                            k.split(":"),
-                        )
-                    )
-                ]
+        elif isinstance(v, dict):
+            return v[k]
         else:
-            tmp = []
-            for inner_v in v:
-                try:
-                    tmp.append(getitem(k, inner_v, default))
-                except KeyError:
-                    continue
-            return tmp
+            # Plain dicts are looked up inline, skipping those without the key
+            values = [
+                inner_v.get(k, _MISSING)
+                if type(inner_v) is dict
+                else getitem_or_missing(k, inner_v, default)
+                for inner_v in v
+            ]
+            return [value for value in values if value is not _MISSING]
+
+    def getitem_or_missing(k, v, default):
+        try:
+            return getitem(k, v, default)
+        except KeyError:
+            return _MISSING
 
     # Wrap a top-level list in a dict
     if isinstance(record, list):
@@ -88,11 +136,13 @@ def get_value(record, key, default=None):
     except KeyError:
         pass
 
-    keys = SPLIT_KEY_PATTERN.split(key)
     value = record
-    for k in keys:
+    for k in _split_key(key):
         try:
-            value = getitem(k, value, default)
+            if isinstance(value, dict) and not isinstance(k, tuple):
+                value = value[k]
+            else:
+                value = getitem(k, value, default)
         except KeyError:
             return default
     return value
@@ -502,6 +552,10 @@ UNDESIRABLE_STRING_REPLACEMENTS = [
     (u'\u201c ', '"'),
 ]
 
+_MEMOIZED_LINE_MAX_LENGTH = 512
+"""Lines shorter than this are memoized by :func:`replace_undesirable_characters`,
+as short strings such as journal or author names tend to repeat a lot."""
+
 
 def replace_undesirable_characters(line):
     """Replace certain bad characters in a text line. @param line: (string) the
@@ -510,6 +564,12 @@ def replace_undesirable_characters(line):
     be replaced. @return: (string) the text line after the
     bad characters have been                   replaced.
     """
+    if len(line) < _MEMOIZED_LINE_MAX_LENGTH:
+        return _replace_undesirable_characters_memoized(line)
+    return _replace_undesirable_characters(line)
+
+
+def _replace_undesirable_characters(line):
     # These are separate because we want a particular order
     for bad_string, replacement in UNDESIRABLE_STRING_REPLACEMENTS:
         line = line.replace(bad_string, replacement)
@@ -518,3 +578,8 @@ def replace_undesirable_characters(line):
         line = line.replace(bad_char, replacement)
 
     return line
+
+
+_replace_undesirable_characters_memoized = lru_cache(maxsize=10000)(
+    _replace_undesirable_characters
+)
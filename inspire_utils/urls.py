@@ -26,6 +26,8 @@ from __future__ import absolute_import, division, print_function
 from six import text_type
 from six.moves.urllib.parse import SplitResult, urlsplit, urlunsplit
 
+from inspire_utils.compat import lru_cache
+
 
 def ensure_scheme(url, default_scheme='http'):
     """Adds a scheme to a url if not present.
@@ -61,4 +63,14 @@ def record_url_by_pattern(pattern, recid):
     Returns:
         string: built record URL
     """
-    return text_type(ensure_scheme(pattern)).format(recid=recid)
+    return _ensure_pattern_scheme(pattern).format(recid=recid)
+
+
+@lru_cache(maxsize=64)
+def _ensure_pattern_scheme(pattern):
+    """Add a scheme to a record URL pattern.
+
+    There are only a handful of patterns, all coming from configuration,
+    so memoizing this spares a ``urlsplit`` round trip per record.
+    """
+    return text_type(ensure_scheme(pattern))
@@ -30,6 +30,7 @@ with open("README.md") as f:
 
 install_requires = [
     'Unidecode~=1.0,>=1.2.0',
+    'backports.functools_lru_cache~=1.6; python_version=="2.7"',
     'babel~=2.9,>=2.9.1',
     'lxml~=5.0',
     'nameparser~=1.1,>=1.1.3',
@@ -24,31 +24,33 @@
 
 from __future__ import absolute_import, division, print_function
 
-import os
-
 import pytest
 
 from inspire_utils.config import Config, MalformedConfig, load_config
 
 
-@pytest.fixture()
-def _restore_cwd():
-    cwd = os.getcwd()
-    yield
-    os.chdir(cwd)
+@pytest.fixture(scope='session')
+def config_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('config') / 'inspirehep.cfg'
+    path.write_text(u"SERVER_NAME = '0.0.0.0'; OTHER_VARIABLE = 42")
+    return str(path)
+
 
+@pytest.fixture(scope='session')
+def empty_config_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('empty_config') / 'inspirehep.cfg'
+    path.write_text(u'')
+    return str(path)
 
-def test_config(tmpdir):
-    mock_config = tmpdir.join("inspirehep.cfg")
-    mock_config.write("SERVER_NAME = '0.0.0.0'; OTHER_VARIABLE = 42")
 
+def test_config(config_file):
     config = Config(
         defaults={
             'SERVER_NAME': '127.0.0.1',
             'SOME_OTHER_DEFAULT': 1234,
         }
     )
-    config.load_pyfile(mock_config.strpath)
+    config.load_pyfile(config_file)
 
     assert config['SERVER_NAME'] == '0.0.0.0'
     assert config['OTHER_VARIABLE'] == 42
@@ -56,48 +58,44 @@ def test_config(tmpdir):
     assert 'NOT_IN_CONFIG' not in config
 
 
-def test_config_empty_file(tmpdir):
-    mock_config = tmpdir.join("inspirehep.cfg")
-    mock_config.write("")
-
+def test_config_empty_file(empty_config_file):
     config = Config()
-    config.load_pyfile(mock_config.strpath)
+    config.load_pyfile(empty_config_file)
 
     assert 'NOT_IN_CONFIG' not in config
 
 
-def test_config_inexistent_file(tmpdir):
-    mock_config = tmpdir.join("inspirehep.cfg")
-    mock_config.write("FOR_DELETION = 10")
-    mock_config.remove()
+def test_config_inexistent_file(tmp_path):
+    mock_config = tmp_path / "inspirehep.cfg"
+    mock_config.write_text(u"FOR_DELETION = 10")
+    mock_config.unlink()
 
     config = Config()
 
     with pytest.raises(IOError, match="No such file or directory"):
-        config.load_pyfile(mock_config.strpath)
+        config.load_pyfile(str(mock_config))
 
 
-def test_config_invalid_file(tmpdir):
-    mock_config = tmpdir.join("inspirehep.cfg")
-    mock_config.write("this is py#0n G1|3|3er1sh")
+def test_config_invalid_file(tmp_path):
+    mock_config = tmp_path / "inspirehep.cfg"
+    mock_config.write_text(u"this is py#0n G1|3|3er1sh")
 
     config = Config()
 
     with pytest.raises(MalformedConfig):
-        config.load_pyfile(mock_config.strpath)
+        config.load_pyfile(str(mock_config))
 
 
-@pytest.mark.usefixtures(name="_restore_cwd")
-def test_load_config(tmpdir):
-    mock_inspirehep_var_cfg = (
-        tmpdir.mkdir('var').mkdir('inspirehep-instance').join("inspirehep.cfg")
-    )
-    mock_inspirehep_var_cfg.write("SERVER_NAME = '0.0.0.0'")
+def test_load_config(tmp_path, monkeypatch):
+    mock_inspirehep_var_cfg_dir = tmp_path / 'var' / 'inspirehep-instance'
+    mock_inspirehep_var_cfg_dir.mkdir(parents=True)
+    mock_inspirehep_var_cfg = mock_inspirehep_var_cfg_dir / "inspirehep.cfg"
+    mock_inspirehep_var_cfg.write_text(u"SERVER_NAME = '0.0.0.0'")
 
-    mock_inspirehep_cfg = tmpdir.join("inspirehep.cfg")
-    mock_inspirehep_cfg.write("SERVER_NAME = '127.0.0.1'; OTHER_VARIABLE = 42")
+    mock_inspirehep_cfg = tmp_path / "inspirehep.cfg"
+    mock_inspirehep_cfg.write_text(u"SERVER_NAME = '127.0.0.1'; OTHER_VARIABLE = 42")
 
-    os.chdir(tmpdir.strpath)
+    monkeypatch.chdir(str(tmp_path))
     config = load_config()
 
     assert config['SERVER_NAME'] == '127.0.0.1'
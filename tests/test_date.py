@@ -33,6 +33,11 @@ from inspire_utils.date import (
 )
 
 
+@pytest.fixture(scope='session')
+def june_1686():
+    return PartialDate(1686, 6)
+
+
 def test_loads_validate_dates_day():
     with pytest.raises(ValueError, match='Day must be in DD format'):
         PartialDate.loads('2015-10-1')
@@ -74,8 +79,8 @@ def test_partial_date_raises_on_wrong_types():
         PartialDate('1686', '6', '30')
 
 
-def test_partial_date_equality():
-    assert PartialDate(1686, 6) == PartialDate(1686, 6)
+def test_partial_date_equality(june_1686):
+    assert june_1686 == PartialDate(1686, 6)
 
 
 def test_partial_date_self_inequality():
@@ -92,22 +97,18 @@ def test_partial_date_sorts_incomplete_dates_after_complete_dates():
     assert not incomplete < complete
 
 
-def test_partial_date_loads():
-    expected = PartialDate(1686, 6)
-
-    assert expected == PartialDate.loads('1686-06')
-
+def test_partial_date_loads(june_1686):
+    assert june_1686 == PartialDate.loads('1686-06')
 
-def test_partial_date_from_parts():
-    expected = PartialDate(1686, 6)
 
-    assert expected == PartialDate.from_parts(1686, 'June')
+def test_partial_date_from_parts(june_1686):
+    assert june_1686 == PartialDate.from_parts(1686, 'June')
 
 
-def test_partial_date_pprints_when_cast_to_str():
+def test_partial_date_pprints_when_cast_to_str(june_1686):
     expected = 'Jun, 1686'
 
-    assert expected == str(PartialDate(1686, 6))
+    assert expected == str(june_1686)
 
 
 def test_partial_date_pprints_correct_date():
@@ -120,39 +121,38 @@ def test_partial_date_pprints_correct_date():
     assert expected_no_month == PartialDate(1890).pprint()
 
 
-def test_format_date():
-    expected = u'Jun 30, 1686'
-    result = format_date('1686-06-30')
-
-    assert expected == result
-
-
-def test_format_date_incomplete():
-    expected = u'Jun, 1686'
-    result = format_date('1686-06')
-
-    assert expected == result
-
-
-def test_normalize_date_handles_ISO():
-    expected = '1686-06-30'
-    result = normalize_date('1686-06-30')
-
-    assert expected == result
-
-
-def test_normalize_date_handles_year_only():
-    expected = '1686'
-    result = normalize_date('1686')
-
-    assert expected == result
-
-
-def test_normalize_date_handles_year_month():
-    expected = '1686-06'
-    result = normalize_date('1686-06')
-
-    assert expected == result
+@pytest.mark.parametrize(
+    ('date', 'expected'),
+    [
+        ('1686-06-30', u'Jun 30, 1686'),
+        ('1686-06', u'Jun, 1686'),
+    ],
+    ids=[
+        'complete date',
+        'incomplete date',
+    ],
+)
+def test_format_date(date, expected):
+    assert expected == format_date(date)
+
+
+@pytest.mark.parametrize(
+    ('date', 'expected'),
+    [
+        ('1686-06-30', '1686-06-30'),
+        ('1686', '1686'),
+        ('1686-06', '1686-06'),
+        ('Fri June 30 1686', '1686-06-30'),
+    ],
+    ids=[
+        'ISO',
+        'year only',
+        'year and month',
+        'human friendly',
+    ],
+)
+def test_normalize_date(date, expected):
+    assert expected == normalize_date(date)
 
 
 @pytest.mark.xfail(reason='Output is wrong as year has less than 4 digits')
@@ -164,13 +164,6 @@ def test_normalize_date_handles_default_dates():
     assert default_date2 == normalize_date('0002-02-02')
 
 
-def test_normalize_date_handles_human_friendly_dates():
-    expected = '1686-06-30'
-    result = normalize_date('Fri June 30 1686')
-
-    assert expected == result
-
-
 def test_normalize_date_raises_on_dates_without_year():
     with pytest.raises(ValueError, match='date does not contain a year'):
         normalize_date('Fri June 30')
@@ -22,6 +22,8 @@
 
 from __future__ import absolute_import, division, print_function
 
+import pytest
+
 from inspire_utils.helpers import (
     force_list,
     maybe_float,
@@ -30,30 +32,23 @@ from inspire_utils.helpers import (
 )
 
 
-def test_force_list_returns_empty_list_on_none():
-    expected = []
-    result = force_list(None)
-
-    assert expected == result
-
-
-def test_force_list_wraps_strings_in_a_list():
-    expected = ['foo']
-    result = force_list('foo')
-
-    assert expected == result
-
-
-def test_force_list_converts_tuples_to_lists():
-    expected = ['foo', 'bar', 'baz']
-    result = force_list(('foo', 'bar', 'baz'))
-
-    assert expected == result
-
-
-def test_force_list_does_not_touch_lists():
-    expected = ['foo', 'bar', 'baz']
-    result = force_list(['foo', 'bar', 'baz'])
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    [
+        (None, []),
+        ('foo', ['foo']),
+        (('foo', 'bar', 'baz'), ['foo', 'bar', 'baz']),
+        (['foo', 'bar', 'baz'], ['foo', 'bar', 'baz']),
+    ],
+    ids=[
+        'returns empty list on none',
+        'wraps strings in a list',
+        'converts tuples to lists',
+        'does not touch lists',
+    ],
+)
+def test_force_list(data, expected):
+    result = force_list(data)
 
     assert expected == result
 
@@ -80,38 +75,24 @@ def test_maybe_int_returns_none_otherwise():
     assert maybe_int('216+337') is None
 
 
-def test_remove_tags_allowed_trees_strip():
-    allowed_trees = ('b',)
-    strip = '@class="hidden"'
-    snippet = ('<p><b><i>Only</i></b> this text remains.'
-               '<span class="hidden">Not this one.</span></p>')
-
-    result = remove_tags(snippet, allowed_trees=allowed_trees, strip=strip)
-    expected = u'<b><i>Only</i></b> this text remains.'
-
-    assert result == expected
-
-
-def test_remove_tags_allowed_tags_strip():
-    allowed_tags = ('b',)
-    strip = '@class="hidden"'
-    snippet = ('<p><b><i>Only</i></b> this text remains.'
-                '<span class="hidden">Not this one.</span></p>')
-
-    result = remove_tags(snippet, allowed_tags=allowed_tags, strip=strip)
-    expected = u'<b>Only</b> this text remains.'
-
-    assert result == expected
-
-
-def test_remove_tags_allowed_tags_strip_preserves_text():
-    allowed_tags = ('i',)
-    strip = '@class="hidden"'
+@pytest.mark.parametrize(
+    ('kwargs', 'expected'),
+    [
+        ({'allowed_trees': ('b',)}, u'<b><i>Only</i></b> this text remains.'),
+        ({'allowed_tags': ('b',)}, u'<b>Only</b> this text remains.'),
+        ({'allowed_tags': ('i',)}, u'<i>Only</i> this text remains.'),
+    ],
+    ids=[
+        'allowed trees',
+        'allowed tags',
+        'allowed tags preserve text',
+    ],
+)
+def test_remove_tags_strip(kwargs, expected):
     snippet = ('<p><b><i>Only</i></b> this text remains.'
                '<span class="hidden">Not this one.</span></p>')
 
-    result = remove_tags(snippet, allowed_tags=allowed_tags, strip=strip)
-    expected = u'<i>Only</i> this text remains.'
+    result = remove_tags(snippet, strip='@class="hidden"', **kwargs)
 
     assert result == expected
 
@@ -27,6 +27,7 @@ from mock import patch
 
 from inspire_utils.name import (
     ParsedName,
+    _generate_name_variations,
     format_name,
     generate_name_variations,
     normalize_name,
@@ -130,6 +131,15 @@ def test_normalize_name_handles_titles(input_author_name, expected):
     assert normalize_name(input_author_name) == expected
 
 
+def test_normalize_name_handles_titles_after_format_name_without_titles():
+    assert normalize_name(u"Sir John Smith") == u"Smith, John"
+
+    format_name(u"Smith, John", without_titles=True)
+
+    assert normalize_name(u"Sir John Smith") == u"Smith, John"
+    assert normalize_name(u"Roe, Dr Jane") == u"Roe, Jane"
+
+
 def test_generate_name_variations_with_two_non_lastnames():
     name = "Ellis, John Richard"
     expected_name_variations = {
@@ -381,6 +391,40 @@ def test_generate_name_variations_with_short_lastname_and_initial():
     assert set(result) == expected
 
 
+def test_generate_name_variations_returns_a_new_list_on_every_call():
+    name = "Oz, Y"
+
+    result = generate_name_variations(name)
+    result.append(u"mutated")
+
+    assert u"mutated" not in generate_name_variations(name)
+
+
+def test_generate_name_variations_after_format_name_without_titles():
+    name = u"Sir John Smith"
+    expected = {
+        # Lastname only
+        u"smith",
+        # Lastnames first and then non lastnames
+        u"smith j",
+        u"smith, j",
+        u"smith john",
+        u"smith, john",
+        # Non lastnames first and then lastnames
+        u"j smith",
+        u"j, smith",
+        u"john smith",
+        u"john, smith",
+    }
+
+    assert set(generate_name_variations(name)) == expected
+
+    format_name(u"Smith, John", without_titles=True)
+
+    assert set(generate_name_variations(name)) == expected
+    assert set(_generate_name_variations.__wrapped__(name)) == expected
+
+
 def test_parsed_name_from_parts():
     parsed_name = ParsedName.from_parts("John", "Smith", "Peter", "Jr", "Sir")
 
@@ -22,7 +22,13 @@
 
 from __future__ import absolute_import, division, print_function
 
-from inspire_utils.record import get_value, get_values_for_schema
+import pytest
+
+from inspire_utils.record import (
+    get_value,
+    get_values_for_schema,
+    replace_undesirable_characters,
+)
 
 
 def test_get_value_returns_all_values():
@@ -73,6 +79,73 @@ def test_get_value_allows_slices_in_paths():
     assert expected == result
 
 
+def test_get_value_allows_last_index_in_paths():
+    record = {
+        'titles': [
+            {'title': 'first title'},
+            {'title': 'second title'},
+        ],
+    }
+
+    expected = 'second title'
+    result = get_value(record, 'titles.title[n]')
+
+    assert expected == result
+
+
+def test_get_value_allows_indexes_without_opening_bracket_in_paths():
+    record = {
+        'titles': [
+            {'title': 'first title'},
+            {'title': 'second title'},
+        ],
+    }
+
+    expected = {'title': 'first title'}
+    result = get_value(record, 'titles.0]')
+
+    assert expected == result
+
+
+def test_get_value_allows_stepped_slices_in_paths():
+    record = {
+        'titles': [
+            {'title': 'first title'},
+            {'title': 'second title'},
+            {'title': 'third title'},
+        ],
+    }
+
+    expected = [
+        'first title',
+        'third title',
+    ]
+    result = get_value(record, 'titles.title[::2]')
+
+    assert expected == result
+
+
+def test_get_value_returns_default_for_invalid_index_on_missing_path():
+    record = {'titles': [{'title': 'first title'}]}
+
+    assert get_value(record, 'abstracts[x]', 'default') == 'default'
+    assert get_value(record, 'abstracts[1:2:3:4]', 'default') == 'default'
+
+
+def test_get_value_raises_for_invalid_index_on_list():
+    record = {'titles': [{'title': 'first title'}]}
+
+    with pytest.raises(ValueError, match='invalid literal'):
+        get_value(record, 'titles[x]')
+
+
+def test_get_value_raises_for_invalid_index_without_opening_bracket_on_list():
+    record = {'titles': [{'title': 'first title'}]}
+
+    with pytest.raises(ValueError, match='invalid literal'):
+        get_value(record, 'titles.x]')
+
+
 def test_get_value_returns_none_if_inner_key_does_not_exist_on_string():
     record = {'foo': 'bar'}
 
@@ -99,3 +172,21 @@ def test_get_values_for_schema():
         {'schema': 'good', 'value': 'third'},
     ]
     assert get_values_for_schema(elements, 'good') == ['first', 'third']
+
+
+def test_get_value_returns_default_if_nested_key_does_not_exist():
+    record = {
+        'abstracts': {'value': 'an abstract'},
+    }
+
+    assert get_value(record, 'abstracts.source', 'default') == 'default'
+    assert get_value(record, 'abstracts.value') == 'an abstract'
+
+
+def test_replace_undesirable_characters():
+    line = u'Phys. Lett. B\u2028 \ufb01eld theory'
+
+    expected = u'Phys. Lett. B field theory'
+
+    assert replace_undesirable_characters(line) == expected
+    assert replace_undesirable_characters(line * 100) == expected * 100